@@ -31,6 +31,8 @@ from .agents import (
     create_github_analyzer_agent,
     create_job_research_agent,
     create_profile_analyzer_agent,
+    create_parallel_research_agent,
+    create_research_pipeline_agent,
     create_orchestrator_agent,
 )
 from .deploy import (
@@ -56,6 +58,8 @@ __all__ = [
     "create_github_analyzer_agent",
     "create_job_research_agent",
     "create_profile_analyzer_agent",
+    "create_parallel_research_agent",
+    "create_research_pipeline_agent",
     "create_orchestrator_agent",
     
     # Deployment
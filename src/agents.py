@@ -6,10 +6,12 @@ agents used in the multi-agent system:
 - GitHub Analyzer Agent
 - Job Requirements Agent
 - Profile Analyzer Agent
+- Research Pipeline (parallel GitHub + job research, then synthesis)
 - Orchestrator Agent (main coordinator)
 """
 
 from google import adk
+from google.adk.agents import ParallelAgent, SequentialAgent
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools.preload_memory_tool import PreloadMemoryTool
@@ -88,19 +90,36 @@ Provide supportive and constructive feedback that:
 - Maintains a positive, motivating tone"""
 
 
+RESEARCH_SYNTHESIS_INSTRUCTIONS = """You combine two independent analyses into one research summary.
+
+GitHub analysis:
+{github_analysis?}
+
+Job requirements:
+{job_requirements?}
+
+Produce a concise summary covering:
+- The candidate's technical profile from GitHub (languages, project depth, impact)
+- Must-have and nice-to-have requirements for the target role
+- Early observations on where the GitHub profile matches or falls short
+
+Do not invent information that is missing from either analysis."""
+
+
 ORCHESTRATOR_INSTRUCTIONS = """You are a career preparation coach helping people prepare for their dream jobs.
 
 CRITICAL WORKFLOW - Follow this EXACT sequence:
 
-**PHASE 1 - Immediate Parallel Analysis (DO THIS FIRST):**
+**PHASE 1 - Research (DO THIS FIRST):**
 When user provides their target role, company, and GitHub username:
-1. IMMEDIATELY call BOTH tools in parallel (do NOT wait for user):
-   - analyze_github_profile(username) 
-   - research_job_requirements(company, role)
+1. IMMEDIATELY call CareerResearchPipeline once (do NOT wait for user),
+   with a request naming the GitHub username, company and role.
+   It analyzes GitHub and job requirements in parallel and returns a
+   combined summary.
 2. Do NOT ask for resume yet - analyze these first
 
 **PHASE 2 - Resume Collection:**
-After receiving results from BOTH parallel tools:
+After receiving the research summary:
 1. Acknowledge what you learned from GitHub and job research
 2. Ask user to paste their resume/LinkedIn profile content
 3. Wait for their response
@@ -139,7 +158,19 @@ Communication style:
 - Provide actionable advice with resources
 - Maintain professional but friendly tone
 
-IMPORTANT: Always trigger parallel tools FIRST before asking for more input."""
+IMPORTANT: Always run the research pipeline FIRST before asking for more input."""
+
+
+# ============================================================================
+# Shared Tools
+# ============================================================================
+
+# FunctionTools are stateless wrappers, so one instance per tool is shared
+# by every agent built below. Agents themselves are not cached: an ADK agent
+# records its parent when composed, so each orchestrator gets fresh ones.
+GITHUB_TOOL = FunctionTool(func=get_github_profile_data)
+JOB_SEARCH_TRIGGER_TOOL = FunctionTool(func=trigger_job_search)
+PROFILE_TOOL = FunctionTool(func=analyze_profile_document)
 
 
 # ============================================================================
@@ -156,13 +187,12 @@ def create_github_analyzer_agent(model_name: str = None) -> adk.Agent:
     Returns:
         Configured GitHub analyzer agent
     """
-    github_tool = FunctionTool(func=get_github_profile_data)
-    
     return adk.Agent(
         name="GitHubAnalyzer",
         model=model_name or Config.MODEL_NAME,
         instruction=GITHUB_AGENT_INSTRUCTIONS,
-        tools=[github_tool],
+        tools=[GITHUB_TOOL],
+        output_key="github_analysis",
     )
 
 
@@ -176,13 +206,12 @@ def create_job_research_agent(model_name: str = None) -> adk.Agent:
     Returns:
         Configured job research agent
     """
-    job_search_trigger_tool = FunctionTool(func=trigger_job_search)
-    
     return adk.Agent(
         name="JobRequirementsResearcher",
         model=model_name or Config.MODEL_NAME,
         instruction=JOB_RESEARCH_AGENT_INSTRUCTIONS,
-        tools=[job_search_trigger_tool],
+        tools=[JOB_SEARCH_TRIGGER_TOOL],
+        output_key="job_requirements",
     )
 
 
@@ -196,13 +225,65 @@ def create_profile_analyzer_agent(model_name: str = None) -> adk.Agent:
     Returns:
         Configured profile analyzer agent
     """
-    profile_tool = FunctionTool(func=analyze_profile_document)
-    
     return adk.Agent(
         name="ProfileAnalyzer",
         model=model_name or Config.MODEL_NAME,
         instruction=PROFILE_AGENT_INSTRUCTIONS,
-        tools=[profile_tool],
+        tools=[PROFILE_TOOL],
+    )
+
+
+def create_parallel_research_agent(model_name: str = None) -> ParallelAgent:
+    """
+    Create agent that runs GitHub analysis and job research concurrently.
+    
+    Each specialist stores its answer in session state (github_analysis,
+    job_requirements) for the synthesis step that follows.
+    
+    Args:
+        model_name: Model to use (defaults to Config.MODEL_NAME)
+        
+    Returns:
+        ParallelAgent wrapping the GitHub analyzer and job researcher
+    """
+    return ParallelAgent(
+        name="ParallelResearch",
+        sub_agents=[
+            create_github_analyzer_agent(model_name),
+            create_job_research_agent(model_name),
+        ],
+    )
+
+
+def create_research_pipeline_agent(model_name: str = None) -> SequentialAgent:
+    """
+    Create the Phase 1 research pipeline.
+    
+    Runs the parallel GitHub + job research, then a synthesis agent that
+    merges both results into the single answer returned to the caller.
+    
+    Args:
+        model_name: Model to use (defaults to Config.MODEL_NAME)
+        
+    Returns:
+        SequentialAgent of parallel research followed by synthesis
+    """
+    synthesizer = adk.Agent(
+        name="ResearchSynthesizer",
+        model=model_name or Config.MODEL_NAME,
+        instruction=RESEARCH_SYNTHESIS_INSTRUCTIONS,
+    )
+    
+    return SequentialAgent(
+        name="CareerResearchPipeline",
+        description=(
+            "Analyzes a GitHub profile and researches job requirements in "
+            "parallel. Request must include GitHub username, company and role."
+        ),
+        sub_agents=[
+            create_parallel_research_agent(model_name),
+            synthesizer,
+        ],
     )
 
 
@@ -211,11 +292,15 @@ def create_orchestrator_agent(model_name: str = None) -> adk.Agent:
     Create main orchestrator agent that coordinates all specialist agents.
     
     The orchestrator manages the workflow:
-    1. Parallel execution of GitHub + Job analysis
+    1. Research pipeline (GitHub + Job analysis run by a ParallelAgent,
+       so concurrency does not depend on the model's tool calling)
     2. Request for resume/profile
     3. Sequential profile analysis
     4. Synthesis and roadmap generation
     
+    Resume analysis stays a separate tool because it needs user input
+    that arrives after the research phase.
+    
     Args:
         model_name: Model to use (defaults to Config.MODEL_NAME)
         
@@ -223,13 +308,11 @@ def create_orchestrator_agent(model_name: str = None) -> adk.Agent:
         Configured orchestrator agent with all specialist agents as tools
     """
     # Create specialist agents
-    github_analyzer = create_github_analyzer_agent(model_name)
-    job_researcher = create_job_research_agent(model_name)
+    research_pipeline = create_research_pipeline_agent(model_name)
     profile_analyzer = create_profile_analyzer_agent(model_name)
     
     # Convert agents to tools
-    github_analyzer_tool = AgentTool(agent=github_analyzer)
-    job_requirements_tool = AgentTool(agent=job_researcher)
+    research_tool = AgentTool(agent=research_pipeline)
     profile_analysis_tool = AgentTool(agent=profile_analyzer)
     
     # Create orchestrator with all tools
@@ -238,8 +321,7 @@ def create_orchestrator_agent(model_name: str = None) -> adk.Agent:
         model=model_name or Config.MODEL_NAME,
         instruction=ORCHESTRATOR_INSTRUCTIONS,
         tools=[
-            github_analyzer_tool,
-            job_requirements_tool,
+            research_tool,
             profile_analysis_tool,
             PreloadMemoryTool(),  # Memory management
         ],
@@ -261,6 +343,12 @@ def get_agent_info() -> None:
             "purpose": "Researches job requirements and expectations",
             "tools": ["trigger_job_search"]
         },
+        {
+            "name": "Career Research Pipeline",
+            "function": "create_research_pipeline_agent()",
+            "purpose": "Runs GitHub + job research in parallel, then synthesizes",
+            "tools": ["GitHub Analyzer", "Job Requirements Researcher"]
+        },
         {
             "name": "Profile Analyzer",
             "function": "create_profile_analyzer_agent()",
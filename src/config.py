@@ -37,9 +37,30 @@ class Config:
         "GOOGLE_APPLICATION_CREDENTIALS"
     )
     
+    # Optional GitHub token; enables the GraphQL profile query
+    GITHUB_TOKEN: Optional[str] = os.getenv(
+        "GITHUB_TOKEN"
+    )
+    
     # Agent Configuration
     MODEL_NAME: str = "gemini-2.0-flash-exp"
     
+    # Tool Configuration
+    CACHE_TTL: int = int(os.getenv(
+        "GITHUB_CACHE_TTL",
+        "300"
+    ))
+    
+    GITHUB_CONCURRENCY: int = int(os.getenv(
+        "GITHUB_CONCURRENCY",
+        "5"
+    ))
+    
+    # Optional Redis cache shared by all replicas (e.g. redis://host:6379/0)
+    REDIS_URL: Optional[str] = os.getenv(
+        "REDIS_URL"
+    )
+    
     # Deployment Configuration
     AGENT_DISPLAY_NAME: str = "Career Preparation Assistant"
     AGENT_DESCRIPTION: str = (
@@ -57,11 +78,17 @@ class Config:
     @classmethod
     def get_requirements(cls) -> list[str]:
         """Get list of Python requirements for deployment."""
-        return [
+        requirements = [
             "google-cloud-aiplatform[agent_engines,adk]>=1.112",
-            "requests>=2.31.0",
+            "aiohttp>=3.9.0",
+            "orjson>=3.9.0",
             "PyPDF2>=3.0.0",
         ]
+        
+        if cls.REDIS_URL:
+            requirements.append("redis>=5.0.1")
+        
+        return requirements
     
     @classmethod
     def validate(cls) -> bool:
@@ -88,6 +115,7 @@ class Config:
         print(f"Staging Bucket:  {cls.STAGING_BUCKET}")
         print(f"Model:           {cls.MODEL_NAME}")
         print(f"Credentials:     {'✓ Set' if cls.CREDENTIALS_PATH else '✗ Not Set'}")
+        print(f"GitHub Token:    {'✓ Set' if cls.GITHUB_TOKEN else '✗ Not Set'}")
         print("=" * 70)
 
 
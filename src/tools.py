@@ -7,80 +7,523 @@ This module contains all the tool functions used by the agents:
 - Professional profile analysis
 """
 
-import requests
+import asyncio
+import contextlib
+import io
 import json
-from typing import Any, Dict
+import re
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
+import aiohttp
+import orjson
 
-async def get_github_profile_data(username: str) -> Dict[str, Any]:
+from .config import Config
+
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "Accept-Encoding": "gzip",
+}
+GITHUB_TIMEOUT = aiohttp.ClientTimeout(total=10)
+GITHUB_MAX_RETRIES = 3
+GITHUB_MAX_BACKOFF = 30  # seconds; longer rate-limit waits are reported as errors
+GITHUB_CACHE_SIZE = 256  # profiles kept in the in-process cache
+
+class _LoopResources:
     """
-    Fetch and return GitHub profile data for analysis.
+    HTTP session, request semaphore, cache-fill locks and Redis client
+    for one event loop.
     
-    This tool retrieves comprehensive GitHub profile information including:
-    - User profile details
-    - Repository information
-    - Programming languages used
-    - Project topics and statistics
+    None of these can be shared across loops. They live as long as the
+    loop, so connections are reused across tool calls, and are closed by
+    _close_at_loop_shutdown when the loop shuts down.
+    """
     
-    Args:
-        username: GitHub username to analyze
+    def __init__(self) -> None:
+        self.shutdown_hook: Optional[AsyncIterator[None]] = None
+        self.session = aiohttp.ClientSession(
+            headers=GITHUB_HEADERS,
+            timeout=GITHUB_TIMEOUT,
+        )
+        self.semaphore = asyncio.Semaphore(Config.GITHUB_CONCURRENCY)
+        self._fill_locks: Dict[str, List[Any]] = {}  # username -> [lock, users]
+        self._redis = None
+    
+    @property
+    def redis(self) -> Optional[Any]:
+        """Redis client, created on first use; None if REDIS_URL is unset."""
+        if self._redis is None and Config.REDIS_URL:
+            try:
+                import redis.asyncio as redis  # Optional dependency
+            except ImportError as e:
+                raise ImportError(
+                    "REDIS_URL is set but the 'redis' package is not installed "
+                    "(pip install 'redis>=5.0.1')"
+                ) from e
+            
+            self._redis = redis.from_url(Config.REDIS_URL, socket_timeout=1)
+        return self._redis
+    
+    @contextlib.asynccontextmanager
+    async def fill_lock(self, username: str) -> AsyncIterator[None]:
+        """Serialize cache fills per username; the lock is dropped once unused."""
+        entry = self._fill_locks.get(username)
+        if entry is None:
+            entry = self._fill_locks[username] = [asyncio.Lock(), 0]
         
-    Returns:
-        Dict containing:
-            - username: GitHub username
-            - profile: User profile information
-            - statistics: Aggregated statistics
-            - repositories: List of repositories (up to 20)
-            - topics: List of unique topics across repos
-            - error: Error message if something went wrong
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._fill_locks[username]
     
-    Example:
-        >>> data = await get_github_profile_data("LaviVasudevan")
-        >>> print(data['profile']['public_repos'])
-        >>> print(data['statistics']['languages'])
+    async def aclose(self) -> None:
+        await self.session.close()
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+_loop_resources: Dict[asyncio.AbstractEventLoop, _LoopResources] = {}
+
+
+async def _close_at_loop_shutdown(
+    loop: asyncio.AbstractEventLoop,
+    resources: _LoopResources,
+) -> AsyncIterator[None]:
+    """
+    Close a loop's resources when the loop shuts down.
+    
+    Event loops aclose() every live async generator in shutdown_asyncgens()
+    (asyncio.run does this before closing), which runs the finally block.
     """
     try:
-        # Fetch user profile
-        user_response = requests.get(
-            f"https://api.github.com/users/{username}",
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=10
-        )
-        
-        if user_response.status_code == 404:
-            return {"error": f"User '{username}' not found on GitHub"}
-        elif user_response.status_code != 200:
-            return {"error": f"GitHub API error: {user_response.status_code}"}
-        
-        user_data = user_response.json()
+        yield
+    finally:
+        _loop_resources.pop(loop, None)
+        await resources.aclose()
+
+
+async def _get_resources() -> _LoopResources:
+    """Return the running loop's resources, creating them on first use."""
+    loop = asyncio.get_running_loop()
+    resources = _loop_resources.get(loop)
+    
+    if resources is None:
+        resources = _loop_resources[loop] = _LoopResources()
+        # Start the generator so the loop tracks it for shutdown
+        resources.shutdown_hook = _close_at_loop_shutdown(loop, resources)
+        await resources.shutdown_hook.__anext__()
+    
+    return resources
+
+
+async def _shared_cache_get(
+    resources: _LoopResources,
+    key: str,
+) -> Optional[Tuple[bytes, float]]:
+    """
+    Read a cached payload and its remaining TTL in seconds from Redis.
+    
+    Redis connection or command failures count as a miss; a missing
+    redis package is a configuration error and is raised.
+    """
+    client = resources.redis
+    if client is None:
+        return None
+    
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            payload, ttl_ms = await pipe.get(key).pttl(key).execute()
+    except Exception:
+        return None
+    
+    if payload is None:
+        return None
+    # PTTL is -1 for a key without expiry, -2 if it expired since the GET
+    ttl = Config.CACHE_TTL if ttl_ms == -1 else max(ttl_ms, 0) / 1000
+    return payload, min(ttl, Config.CACHE_TTL)
+
+
+async def _shared_cache_set(resources: _LoopResources, key: str, payload: bytes) -> None:
+    """Store a payload in Redis for Config.CACHE_TTL seconds, best effort."""
+    client = resources.redis
+    if client is None:
+        return
+    
+    try:
+        await client.set(key, payload, ex=Config.CACHE_TTL)
+    except Exception:
+        pass
+
+
+def _rate_limit_delay(response: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+    """
+    Return seconds to wait before retrying a rate-limited response.
+    
+    Returns None when the response is not a rate limit, retries are
+    exhausted, or GitHub asks us to wait longer than GITHUB_MAX_BACKOFF.
+    """
+    if attempt >= GITHUB_MAX_RETRIES:
+        return None
+    
+    headers = response.headers
+    retry_after = headers.get("Retry-After", "")
+    reset = headers.get("X-RateLimit-Reset", "")
+    rate_limited = (
+        response.status == 429
+        or retry_after
+        or headers.get("X-RateLimit-Remaining") == "0"
+    )
+    if response.status not in (403, 429) or not rate_limited:
+        return None
+    
+    delay = 2 ** attempt
+    if retry_after.isdigit():
+        delay = max(delay, int(retry_after))
+    elif reset.isdigit():
+        delay = max(delay, int(reset) - time.time())
+    
+    return delay if delay <= GITHUB_MAX_BACKOFF else None
+
+
+# Section header keywords for analyze_profile_document; the matching
+# group name becomes the section name. Lines are casefolded before
+# matching, which is faster than a re.IGNORECASE search.
+_SECTION_PATTERN = re.compile(
+    r"(?P<experience>experience|work history|employment)"
+    r"|(?P<education>education|academic|degree)"
+    r"|(?P<skills>skills|expertise|technical skills)"
+    r"|(?P<projects>projects|portfolio)"
+    r"|(?P<certifications>certifications|certificates)"
+)
+
+# Response skeleton for trigger_job_search; only the JSON-encoded dynamic
+# fields are filled in per call
+_JOB_SEARCH_TEMPLATE = (
+    '{{"action": "research_job_requirements", "company": {company}, '
+    '"role": {role}, "status": "ready_for_research", "message": {message}}}'
+)
+
+# Last ETag and trimmed payload (orjson bytes) per URL for conditional
+# requests, least recently used first; two URLs (user + repos) per profile
+_etag_cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+
+
+def _trim_rest_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the REST user fields the aggregation reads."""
+    return {
+        "name": user.get("name"),
+        "bio": user.get("bio"),
+        "location": user.get("location"),
+        "public_repos": user.get("public_repos"),
+        "followers": user.get("followers"),
+    }
+
+
+def _trim_rest_repos(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep only the REST repository fields the aggregation reads."""
+    return [
+        {
+            "name": repo.get("name"),
+            "description": repo.get("description"),
+            "fork": repo.get("fork"),
+            "language": repo.get("language"),
+            "stargazers_count": repo.get("stargazers_count", 0),
+            "forks_count": repo.get("forks_count", 0),
+            "topics": repo.get("topics", []),
+        }
+        for repo in repos
+    ]
+
+
+async def _fetch_json(
+    resources: _LoopResources,
+    url: str,
+    payload: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    shape: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[int, Any]:
+    """
+    Fetch a GitHub API URL and return (status, parsed JSON or None).
+    
+    Requests are GETs unless a JSON payload is given, in which case they
+    are POSTed. shape, if given, trims the parsed JSON before it is
+    returned or stored.
+    
+    GETs send If-None-Match when a previous response carried an ETag.
+    The store keeps the shaped data as orjson bytes, and a 304 decodes a
+    fresh copy of it, reported as 200; GitHub does not count 304s against
+    the rate limit.
+    
+    At most Config.GITHUB_CONCURRENCY requests are in flight per event
+    loop, and rate-limited responses are retried with exponential
+    backoff, honouring Retry-After / X-RateLimit-Reset.
+    """
+    method = "GET" if payload is None else "POST"
+    cached = _etag_cache.get(url) if method == "GET" else None
+    if cached:
+        _etag_cache.move_to_end(url)
+        headers = {**(headers or {}), "If-None-Match": cached[0]}
+    
+    for attempt in range(GITHUB_MAX_RETRIES + 1):
+        async with resources.semaphore:
+            async with resources.session.request(
+                method, url, json=payload, headers=headers
+            ) as response:
+                if response.status == 304 and cached:
+                    return 200, orjson.loads(cached[1])
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if shape is not None:
+                        data = shape(data)
+                    etag = response.headers.get("ETag")
+                    if etag and method == "GET":
+                        _etag_cache[url] = (etag, orjson.dumps(data))
+                        _etag_cache.move_to_end(url)
+                        while len(_etag_cache) > 2 * GITHUB_CACHE_SIZE:
+                            _etag_cache.popitem(last=False)
+                    return response.status, data
                 
-        # Fetch repositories
-        repos_response = requests.get(
-            f"https://api.github.com/users/{username}/repos?per_page=100&sort=updated",
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=10
-        )
-        repos_data = repos_response.json() if repos_response.status_code == 200 else []
+                delay = _rate_limit_delay(response, attempt)
+                if delay is None:
+                    return response.status, None
         
-        # Aggregate data
-        languages = {}
+        # Back off outside the semaphore so other requests can proceed
+        await asyncio.sleep(delay)
+
+
+class _GitHubError(Exception):
+    """GitHub lookup failure, reported to the agent as an error result."""
+
+
+async def _fetch_rest_profile(
+    resources: _LoopResources,
+    username: str,
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]], bool]:
+    """
+    Fetch (user, repos, complete) from the GitHub REST API.
+    
+    complete is False when the repos request failed and repos is empty
+    only because of that failure.
+    """
+    # Fetch user profile and repositories concurrently
+    user_result, repos_result = await asyncio.gather(
+        _fetch_json(
+            resources,
+            f"{GITHUB_API_URL}/users/{username}",
+            shape=_trim_rest_user,
+        ),
+        _fetch_json(
+            resources,
+            f"{GITHUB_API_URL}/users/{username}/repos?per_page=100&sort=updated",
+            shape=_trim_rest_repos,
+        ),
+        return_exceptions=True,
+    )
+    
+    if isinstance(user_result, BaseException):
+        raise user_result
+    
+    user_status, user_data = user_result
+    if user_status == 404:
+        raise _GitHubError(f"User '{username}' not found on GitHub")
+    elif user_status != 200:
+        raise _GitHubError(f"GitHub API error: {user_status}")
+    
+    # A failed repos request degrades to an empty list, as before
+    if isinstance(repos_result, BaseException) or repos_result[0] != 200:
+        return user_data, [], False
+    
+    return user_data, repos_result[1], True
+
+
+# repositoryOwner (unlike user) also resolves organizations, matching
+# REST /users/{login}
+GITHUB_PROFILE_QUERY = """
+query($login: String!) {
+  repositoryOwner(login: $login) {
+    ... on User {
+      name
+      bio
+      location
+      followers { totalCount }
+    }
+    ... on Organization {
+      name
+      description
+      location
+    }
+    repositories(
+      first: 100
+      privacy: PUBLIC
+      ownerAffiliations: OWNER
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      totalCount
+      nodes {
+        name
+        description
+        isFork
+        primaryLanguage { name }
+        stargazerCount
+        forkCount
+        repositoryTopics(first: 10) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
+
+
+async def _fetch_graphql_profile(
+    resources: _LoopResources,
+    username: str,
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]], bool]:
+    """
+    Fetch (user, repos, complete) with a single GitHub GraphQL query.
+    
+    Only the fields used by the aggregation are requested. Results are
+    reshaped to match the REST payloads, so both paths aggregate alike.
+    """
+    status, data = await _fetch_json(
+        resources,
+        f"{GITHUB_API_URL}/graphql",
+        payload={"query": GITHUB_PROFILE_QUERY, "variables": {"login": username}},
+        headers={"Authorization": f"bearer {Config.GITHUB_TOKEN}"},
+    )
+    if status != 200:
+        raise _GitHubError(f"GitHub API error: {status}")
+    
+    user = (data.get("data") or {}).get("repositoryOwner")
+    if user is None:
+        errors = data.get("errors") or []
+        if not errors or any(e.get("type") == "NOT_FOUND" for e in errors):
+            raise _GitHubError(f"User '{username}' not found on GitHub")
+        raise _GitHubError(f"GitHub API error: {errors[0].get('message')}")
+    
+    repositories = user["repositories"]
+    # Organizations have a description instead of a bio, and GraphQL does
+    # not expose their follower count
+    followers = user.get("followers")
+    user_data = {
+        "name": user.get("name"),
+        "bio": user.get("bio", user.get("description")),
+        "location": user.get("location"),
+        "public_repos": repositories["totalCount"],
+        "followers": followers["totalCount"] if followers else None,
+    }
+    repos_data = [
+        {
+            "name": node["name"],
+            "description": node["description"],
+            "fork": node["isFork"],
+            "language": (node["primaryLanguage"] or {}).get("name"),
+            "stargazers_count": node["stargazerCount"],
+            "forks_count": node["forkCount"],
+            "topics": [t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+        }
+        for node in repositories["nodes"]
+    ]
+    
+    return user_data, repos_data, True
+
+
+# Successful profile results as (expiry, orjson payload), least recently
+# used first. Payloads are decoded per hit, so callers never share a dict.
+_profile_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+
+def _profile_cache_get(username: str) -> Optional[Dict[str, Any]]:
+    """Return a fresh copy of the cached profile, or None if missing/expired."""
+    entry = _profile_cache.get(username)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _profile_cache[username]
+        return None
+    
+    _profile_cache.move_to_end(username)
+    return orjson.loads(entry[1])
+
+
+def _profile_cache_put(username: str, payload: bytes, ttl: Optional[float] = None) -> None:
+    """
+    Cache a profile payload for ttl seconds (default Config.CACHE_TTL),
+    evicting the least recently used entries beyond the cap.
+    """
+    if ttl is None:
+        ttl = Config.CACHE_TTL
+    if ttl <= 0:
+        return
+    
+    _profile_cache[username] = (time.monotonic() + ttl, payload)
+    _profile_cache.move_to_end(username)
+    while len(_profile_cache) > GITHUB_CACHE_SIZE:
+        _profile_cache.popitem(last=False)
+
+
+def _cache_clear() -> None:
+    """Reset in-process caches; the shared Redis cache is left alone."""
+    _profile_cache.clear()
+    _etag_cache.clear()
+
+
+async def _fetch_github_profile(
+    resources: _LoopResources,
+    username: str,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Fetch and aggregate a GitHub profile, bypassing the caches.
+    
+    Returns (result, complete). complete is False for errors and for
+    results degraded by a failed repos request; those are not cached.
+    """
+    try:
+        # One GraphQL round-trip when Config.GITHUB_TOKEN is set, two REST
+        # calls otherwise
+        if Config.GITHUB_TOKEN:
+            fetched = await _fetch_graphql_profile(resources, username)
+        else:
+            fetched = await _fetch_rest_profile(resources, username)
+        user_data, repos_data, complete = fetched
+        
+        # Aggregate data in a single pass over the repositories
+        languages = Counter()
         topics = set()
+        topics_update = topics.update
         total_stars = 0
         total_forks = 0
+        top_repos = []
         
-        for repo in repos_data:
+        for i, repo in enumerate(repos_data):
             # Count non-forked repos for language statistics
-            if not repo.get('fork'):
-                if repo.get('language'):
-                    languages[repo['language']] = languages.get(repo['language'], 0) + 1
+            lang = repo.get('language')
+            if lang and not repo.get('fork'):
+                languages[lang] += 1
             
             # Collect topics
-            if repo.get('topics'):
-                topics.update(repo['topics'])
+            if repo_topics := repo.get('topics'):
+                topics_update(repo_topics)
             
             # Aggregate statistics
             total_stars += repo.get('stargazers_count', 0)
             total_forks += repo.get('forks_count', 0)
+            
+            # Keep the top 20 repos
+            if i < 20:
+                top_repos.append({
+                    "name": repo.get("name"),
+                    "description": repo.get("description"),
+                    "language": lang,
+                    "stars": repo.get("stargazers_count"),
+                    "topics": repo_topics or [],
+                })
         
         # Build result
         result = {
@@ -95,28 +538,97 @@ async def get_github_profile_data(username: str) -> Dict[str, Any]:
             "statistics": {
                 "total_stars": total_stars,
                 "total_forks": total_forks,
-                "languages": languages,
+                "languages": dict(languages),
                 "total_topics": len(topics),
             },
-            "repositories": [
-                {
-                    "name": repo.get("name"),
-                    "description": repo.get("description"),
-                    "language": repo.get("language"),
-                    "stars": repo.get("stargazers_count"),
-                    "topics": repo.get("topics", []),
-                }
-                for repo in repos_data[:20]  # Return top 20 repos
-            ],
-            "topics": sorted(list(topics)),
+            "repositories": top_repos,
+            "topics": sorted(topics),
         }
         
-        return result
+        return result, complete
         
-    except requests.RequestException as e:
-        return {"error": f"Network error: {str(e)}"}
+    except _GitHubError as e:
+        return {"error": str(e)}, False
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return {"error": f"Network error: {str(e)}"}, False
     except Exception as e:
-        return {"error": f"Exception: {str(e)}"}
+        return {"error": f"Exception: {str(e)}"}, False
+
+
+async def get_github_profile_data(username: str) -> Dict[str, Any]:
+    """
+    Fetch and return GitHub profile data for analysis.
+    
+    This tool retrieves comprehensive GitHub profile information including:
+    - User profile details
+    - Repository information
+    - Programming languages used
+    - Project topics and statistics
+    
+    Args:
+        username: GitHub username to analyze
+        
+    Returns:
+        Dict containing:
+            - username: GitHub username
+            - profile: User profile information
+            - statistics: Aggregated statistics
+            - repositories: List of repositories (up to 20)
+            - topics: List of unique topics across repos
+            - error: Error message if something went wrong
+    
+    Example:
+        >>> data = await get_github_profile_data("LaviVasudevan")
+        >>> print(data['profile']['public_repos'])
+        >>> print(data['statistics']['languages'])
+    """
+    # Notes kept out of the docstring, which ADK sends to the model:
+    # complete results are cached per username for Config.CACHE_TTL seconds
+    # (in-process, plus Redis when Config.REDIS_URL is set) and revalidated
+    # with ETags afterwards; get_github_profile_data.cache_clear() resets
+    # the in-process caches.
+    result = _profile_cache_get(username)
+    if result is not None:
+        return result
+    
+    resources = await _get_resources()
+    
+    # Concurrent misses for one username wait here so only one of
+    # them reaches Redis / the GitHub API
+    async with resources.fill_lock(username):
+        result = _profile_cache_get(username)
+        if result is not None:
+            return result
+        
+        key = f"gh:{username}"
+        shared = await _shared_cache_get(resources, key)
+        if shared is not None:
+            # Expire locally with the Redis key, not a fresh full TTL
+            payload, ttl = shared
+            _profile_cache_put(username, payload, ttl)
+            return orjson.loads(payload)
+        
+        result, complete = await _fetch_github_profile(resources, username)
+        
+        # Errors and degraded results are served once, never cached,
+        # so a transient failure cannot spread to other replicas
+        if complete:
+            payload = orjson.dumps(result)
+            await _shared_cache_set(resources, key, payload)
+            _profile_cache_put(username, payload)
+        return result
+
+
+get_github_profile_data.cache_clear = _cache_clear
+
+
+def _json_string(value: str) -> str:
+    """JSON-encode a string with orjson, falling back to json for lone surrogates."""
+    try:
+        return orjson.dumps(value).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects strings that are not valid UTF-8; json escapes them
+        return json.dumps(value)
 
 
 async def trigger_job_search(company: str, role: str) -> str:
@@ -142,13 +654,11 @@ async def trigger_job_search(company: str, role: str) -> str:
         >>> print(result)
         {"action": "research_job_requirements", ...}
     """
-    return json.dumps({
-        "action": "research_job_requirements",
-        "company": company,
-        "role": role,
-        "status": "ready_for_research",
-        "message": f"Ready to research {role} position at {company}"
-    })
+    return _JOB_SEARCH_TEMPLATE.format(
+        company=_json_string(company),
+        role=_json_string(role),
+        message=_json_string(f"Ready to research {role} position at {company}"),
+    )
 
 
 async def analyze_profile_document(profile_text: str) -> Dict[str, Any]:
@@ -185,40 +695,39 @@ async def analyze_profile_document(profile_text: str) -> Dict[str, Any]:
         using NLP libraries or ML models for better extraction.
     """
     try:
+        # Sample kept for reference; CPython returns profile_text itself
+        # (no copy) when it is already 1000 chars or shorter
+        head = profile_text[:1000]
+        
         profile = {
             "skills": [],
             "experience": [],
             "education": [],
-            "raw_text": profile_text[:1000],  # Store sample for reference
+            "raw_text": head,
             "sections": {}
         }
         
-        lines = profile_text.split('\n')
+        sections = defaultdict(list)
         current_section = "unknown"
+        current_bucket = None  # Bound on the section's first non-empty line
         
-        # Simple section detection based on keywords
-        for line in lines:
-            line_lower = line.lower().strip()
-            
+        # Simple section detection based on keywords; StringIO yields
+        # lines lazily instead of materializing the whole split list
+        for line in io.StringIO(profile_text):
             # Detect section headers
-            if any(kw in line_lower for kw in ['experience', 'work history', 'employment']):
-                current_section = "experience"
-            elif any(kw in line_lower for kw in ['education', 'academic', 'degree']):
-                current_section = "education"
-            elif any(kw in line_lower for kw in ['skills', 'expertise', 'technical skills']):
-                current_section = "skills"
-            elif any(kw in line_lower for kw in ['projects', 'portfolio']):
-                current_section = "projects"
-            elif any(kw in line_lower for kw in ['certifications', 'certificates']):
-                current_section = "certifications"
-            
-            # Initialize section if not exists
-            if current_section not in profile["sections"]:
-                profile["sections"][current_section] = []
+            match = _SECTION_PATTERN.search(line.casefold())
+            if match and match.lastgroup != current_section:
+                current_section = match.lastgroup
+                current_bucket = None
             
             # Add line to current section
-            if line.strip():  # Only add non-empty lines
-                profile["sections"][current_section].append(line.strip())
+            if line_strip := line.strip():  # Only add non-empty lines
+                if current_bucket is None:
+                    current_bucket = sections[current_section]
+                current_bucket.append(line_strip)
+        
+        # Plain dict keeps the result JSON-serializable
+        profile["sections"] = dict(sections)
         
         # Populate top-level fields from sections
         if "skills" in profile["sections"]:
@@ -236,36 +745,34 @@ async def analyze_profile_document(profile_text: str) -> Dict[str, Any]:
         return {"error": f"Analysis error: {str(e)}"}
 
 
-# Tool metadata for documentation
-TOOL_METADATA = {
-    "get_github_profile_data": {
-        "name": "GitHub Profile Analyzer",
-        "description": "Analyzes GitHub profile for technical skills assessment",
-        "parameters": ["username"],
-        "returns": "Comprehensive GitHub profile data with statistics"
-    },
-    "trigger_job_search": {
-        "name": "Job Requirements Research Trigger",
-        "description": "Initiates research for job requirements",
-        "parameters": ["company", "role"],
-        "returns": "Confirmation with research parameters"
-    },
-    "analyze_profile_document": {
-        "name": "Professional Profile Analyzer",
-        "description": "Extracts structured data from resume/profile text",
-        "parameters": ["profile_text"],
-        "returns": "Structured profile data with sections"
-    }
-}
-
-
 def get_tool_info() -> None:
     """Print information about available tools."""
+    tool_metadata = {
+        "get_github_profile_data": {
+            "name": "GitHub Profile Analyzer",
+            "description": "Analyzes GitHub profile for technical skills assessment",
+            "parameters": ["username"],
+            "returns": "Comprehensive GitHub profile data with statistics"
+        },
+        "trigger_job_search": {
+            "name": "Job Requirements Research Trigger",
+            "description": "Initiates research for job requirements",
+            "parameters": ["company", "role"],
+            "returns": "Confirmation with research parameters"
+        },
+        "analyze_profile_document": {
+            "name": "Professional Profile Analyzer",
+            "description": "Extracts structured data from resume/profile text",
+            "parameters": ["profile_text"],
+            "returns": "Structured profile data with sections"
+        }
+    }
+    
     print("\n" + "=" * 70)
     print("Available Tools")
     print("=" * 70)
     
-    for tool_name, metadata in TOOL_METADATA.items():
+    for tool_name, metadata in tool_metadata.items():
         print(f"\n📦 {metadata['name']}")
         print(f"   Function: {tool_name}")
         print(f"   Description: {metadata['description']}")